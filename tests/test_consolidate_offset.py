@@ -169,6 +169,21 @@ class TestSessionPersistence:
         assert history[0]["content"] == "msg20"
         assert history[-1]["content"] == "msg29"
 
+    def test_failed_save_keeps_previous_file(self, temp_manager):
+        """Test that an interrupted save does not truncate the stored session."""
+        session = create_session_with_messages("test:atomic", 5)
+        temp_manager.save(session)
+
+        session.messages.append({"role": "user", "content": object()})
+        with pytest.raises(TypeError):
+            temp_manager.save(session)
+
+        temp_manager.invalidate("test:atomic")
+        reloaded = temp_manager.get_or_create("test:atomic")
+        assert len(reloaded.messages) == 5
+        assert [s["key"] for s in temp_manager.list_sessions()] == ["test:atomic"]
+        assert not list(temp_manager.sessions_dir.glob("*.tmp"))
+
     def test_clear_resets_session(self, temp_manager):
         """Test that clear() properly resets session."""
         session = create_session_with_messages("test:clear", 10)